@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+from functools import wraps
 
 def pairwise_symnetric_result(func, dls, X, y, col0="X0", col1="X1"):
     temp_clone = X.copy()
@@ -22,6 +23,22 @@ def equality_result(func, dls, X, y, cols=["X0", "X1"]):
     return predeq
 
 
+def vectorized_constraint(func):
+    """
+    Makes a constraint work on numpy arrays, it is called as func(dls, X_cols, y) where X_cols is a tuple of the columns of X
+    A DataFrame X and Series y are converted with dls.get_arrays, so the constraint can be passed to set_add_func directly or wrapped in a lambda
+    The constraint must return a single number
+    """
+    @wraps(func)
+    def wrapper(dls, X, y, **kwargs):
+        if isinstance(X, pd.DataFrame) or isinstance(y, pd.Series):
+            X, y = dls.get_arrays(X, y)
+        violation = func(dls, X, y, **kwargs)
+        if np.ndim(violation) != 0:
+            raise ValueError(f"Constraint {func.__name__} must return a single number, returned shape {np.shape(violation)}")
+        return violation
+    return wrapper
+
 def get_floored_max(series, floor=0):
     return max(np.append(series, floor))
 
@@ -2,9 +2,10 @@
 Define all the symbols/ operations we plan to use here
 Must be registered in the dictionary to actually work properly
 
-The input to these functions can be either a float/ int or a 1 entry panda series
+The input to these functions is usually a whole column of the dataset as a numpy array but can also be a single float/ int
 
-Should return a pandas series or a number doesn't matter (I think)
+They must work elementwise and return an array (or a number) of the same shape, use numpy ufuncs or np.where so whole columns are evaluated at once
+Protected functions apply their protection per element rather than to the whole column
 
 
 Currently Defined Functions
@@ -14,26 +15,29 @@ func_set : list
             ‘add’ : addition, arity=2.
             ‘sub’ : subtraction, arity=2.
             ‘mul’ : multiplication, arity=2.
-            ‘div’ : protected division where a denominator near-zero returns 1., arity=2.
-            ‘sqrt’ : protected square root where the absolute value of the argument is used, arity=1.
-            ‘log’ : protected log where the absolute value of the argument is used and a near-zero argument returns 0., arity=1.
+            ‘div’ : protected division where a denominator within 0.0001 of zero returns 1., arity=2.
+            ‘sqrt’ : protected square root where an argument at or below 0.000001 returns 0., arity=1.
+            ‘log’ : protected log where an argument at or below 0.000000001 returns 0., arity=1.
             ‘abs’ : absolute value, arity=1.
             ‘neg’ : negative, arity=1.
-            ‘inv’ : protected inverse where a near-zero argument returns 0., arity=1.
+            ‘inv’ : protected inverse where an argument at or below 0.0001 returns 0., arity=1.
             ‘max’ : maximum, arity=2.
             ‘min’ : minimum, arity=2.
             ‘sin’ : sine (radians), arity=1.
             ‘cos’ : cosine (radians), arity=1.
             ‘tan’ : tangent (radians), arity=1.
-            'exp' : exponential , arity=1
-            'pow' : power , arity=2
-            'square': ^2, arity=1
+            'arcsin' : inverse sine, arity=1
+            'arccos' : inverse cosine, arity=1
+            'arctan' : inverse tangent, arity=1
+            'exp' : protected exponential where an argument of magnitude 100 or more returns 0. , arity=1
+            'pow' : protected power where a non finite result returns 0. , arity=2
+            'square': protected ^2 where a non finite result returns 0., arity=1
 """
 
 
 import numpy as np
 import pandas as pd
-import operator
+from inspect import signature
 
 
 def is_series(x):
@@ -44,104 +48,73 @@ def is_series(x):
 
 
 def div(x1, x2):
-    x1, x2 = pd.Series(x1), pd.Series(x2)
-    if all(np.abs(x2) > 0.0001):
-        return x1/x2
-    else:
-        return pd.Series(0)
+    safe = np.abs(x2) > 0.0001
+    return np.where(safe, x1 / np.where(safe, x2, 1.0), 1.0)
 
 
 def exponent(x1):
-    x1 = pd.Series(x1)
-    if all(np.abs(x1) < 100):
-        return np.exp(x1)
-    return pd.Series(0)
+    safe = np.abs(x1) < 100
+    return np.where(safe, np.exp(np.where(safe, x1, 0.0)), 0.0)
 
 def _logical(x1, x2, x3, x4):
     return np.where(x1 > x2, x3, x4)[0]
 
 def power(x1, x2):
-    x1, x2 = pd.Series(x1), pd.Series(x2)
     val = np.power(x1, x2)
-    if not all(np.isfinite(val)):
-        return pd.Series(0)
-    else:
-        return val
+    return np.where(np.isfinite(val), val, 0.0)
 
 def square(x1):
-    return power(x1, 2)
-
-def sin(x):
-    return np.sin(x)
-
-def arcsin(x):
-    return np.arcsin(x)
-
-def cos(x):
-    return np.cos(x)
-
-def arccos(x):
-    return np.arccos(x)
-
-def tan(x):
-    return np.tan(x)
-
-def arctan(x):
-    return np.arctan(x)
+    val = np.square(x1)
+    return np.where(np.isfinite(val), val, 0.0)
 
 def log(x):
-    x = pd.Series(x)
-    if all(x > 0.000000001):
-        return np.log(x)
-    return pd.Series(0)
+    safe = x > 0.000000001
+    return np.where(safe, np.log(np.where(safe, x, 1.0)), 0.0)
 
 
-def abs(x):
-    return np.abs(x)
-
 def inv(x):
-    x = pd.Series(x)
-    if all(x > 0.0001):
-        return 1/x
-    return pd.Series(0)
+    safe = x > 0.0001
+    return np.where(safe, 1 / np.where(safe, x, 1.0), 0.0)
 
 def sqrt(x):
-    x = pd.Series(x)
-    if all(x > 0.000001):
-        return np.sqrt(x)
-    return 0
-
-
-def add(x, y):
-    #print(type(x))
-    return operator.add(x, y)
-
-def neg(x):
-    return -x
+    safe = x > 0.000001
+    return np.where(safe, np.sqrt(np.where(safe, x, 1.0)), 0.0)
 
 
 
 
 
 func_dict = {
-    "add" : add,
-    "sub" : operator.sub,
-    "mul" : operator.mul,
+    "add" : np.add,
+    "sub" : np.subtract,
+    "mul" : np.multiply,
     "div" : div,
     "exp" : exponent,
     "pow" : power,
-    "sin" : sin,
-    "cos" : cos,
-    "arcsin" : arcsin,
-    "arccos" : arccos,
-    "tan" : tan,
-    "arctan" : arctan,
+    "sin" : np.sin,
+    "cos" : np.cos,
+    "arcsin" : np.arcsin,
+    "arccos" : np.arccos,
+    "tan" : np.tan,
+    "arctan" : np.arctan,
     "log" : log,
-    "abs" : abs,
+    "abs" : np.abs,
     "inv" : inv,
-    "max" : max,
-    "min" : min,
+    "max" : np.maximum,
+    "min" : np.minimum,
     "sqrt": sqrt,
     "square": square,
-    "neg": neg
-    }
\ No newline at end of file
+    "neg": np.negative
+    }
+
+
+def get_arity(func):
+    """
+    returns the number of arguments func takes
+    """
+    if isinstance(func, np.ufunc):
+        return func.nin
+    return len(signature(func).parameters)
+
+
+ARITY = {name : get_arity(func) for name, func in func_dict.items()}
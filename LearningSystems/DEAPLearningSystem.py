@@ -1,8 +1,11 @@
-from inspect import signature
 import operator
 import traceback
 import warnings
 import random
+import types
+import multiprocessing
+from functools import partial
+from collections import OrderedDict
 warnings.filterwarnings("ignore")
 
 
@@ -16,12 +19,43 @@ from deap import tools
 from deap import algorithms
 from deap import gp
 import numpy as np
+try:
+    import numba
+except ImportError:
+    numba = None
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
+
+
+_worker_system = None
+
+def _init_worker(dls):
+    """
+    Pool initializer, stores the DEAPLearningSystem the worker was forked with
+
+    Every worker is forked with the same random state so they are reseeded from fresh entropy, otherwise generators would hand every worker the same samples
+    """
+    global _worker_system
+    _worker_system = dls
+    np.random.seed()
+    random.seed()
+
+def _worker_call(alias, ind):
+    """
+    Calls the toolbox function registered under alias on ind using the worker's copy of the DEAPLearningSystem
+    """
+    return getattr(_worker_system.toolbox, alias)(ind)
 
 class DEAPLearningSystem(LearningSystem):
     """
     Learning Algorithm that implements the DEAP Python Library
     """
-    def __init__(self, path="DEAP_data", verbose=False, population_size=100, crossover_prob=0.3, mutation_prob=0.9, ngens=30, algorithm="simple", func_list=['add', 'mul', 'sub', 'div', 'sin', 'cos', 'tan', 'exp', 'sqrt']):
+    cache_size = 10000
+    jit_after = 3
+
+    def __init__(self, path="DEAP_data", verbose=False, population_size=100, crossover_prob=0.3, mutation_prob=0.9, ngens=30, algorithm="simple", func_list=['add', 'mul', 'sub', 'div', 'sin', 'cos', 'tan', 'exp', 'sqrt'], n_jobs=1, jit=False, dtype=np.float64, device="cpu", max_height=10):
         """
         Parameters
         -----------
@@ -53,8 +87,42 @@ class DEAPLearningSystem(LearningSystem):
             List of strings i.e names of functions to include / operations to consider
             Check Customizations for full list
 
+        n_jobs : int or None
+            Number of worker processes used to evaluate the population. 1 evaluates serially, None uses every core
+
+        jit : boolean
+            True iff equations should be JIT compiled with numba. Equations numba cannot compile run as plain Python
+            Compiling an equation takes far longer than evaluating it on typical dataset sizes and most equations in a run are new,
+            so only equations compiled jit_after times are JIT compiled. With fit on a fixed X and y every equation is scored once through
+            the fitness cache and never recurs, so jit is only supported with fit_gen and fit raises a ValueError when it is set
+
+        dtype : numpy floating type or anything np.dtype accepts ("float32", np.dtype("float32") etc)
+            Type the data and predictions are held in during evaluation. np.float32 halves the memory traffic of evaluation
+            The squared error is always accumulated in float64 so fitnesses stay comparable
+
+        device : str
+            Where the fixed training data is evaluated. Current options
+            cpu: numpy
+            cuda: cupy arrays on the GPU, only worth it for very large datasets and best combined with dtype=np.float32
+
+        max_height : int
+            Maximum height of an equation tree. Mutations and crossovers that would grow a tree past it are undone
+
         """
         LearningSystem.__init__(self)
+        if jit and numba is None:
+            raise ImportError("jit=True requires numba to be installed")
+        if device not in ("cpu", "cuda"):
+            raise ValueError(f"Unknown device {device}. Current options are cpu and cuda")
+        if device == "cuda":
+            if cp is None:
+                raise ImportError("device='cuda' requires cupy to be installed")
+            if n_jobs != 1:
+                raise ValueError("device='cuda' can not be used with n_jobs other than 1 as the workers would share one CUDA context")
+        if not np.issubdtype(np.dtype(dtype), np.floating):
+            raise ValueError(f"dtype must be a floating point type, got {dtype}")
+        if n_jobs != 1 and "fork" not in multiprocessing.get_all_start_methods():
+            raise ValueError("n_jobs other than 1 needs the fork start method which is not available on this platform")
         self.toolbox = base.Toolbox()
         self.path = path
         self.verbose = verbose
@@ -67,6 +135,15 @@ class DEAPLearningSystem(LearningSystem):
         self.add_func = lambda dls, x, y : 0 # Zero Function Default
         self.lgml_func = lambda ind, dls=None, gen=None: (None, None) # Assume all true
         self.creator = creator
+        self.n_jobs = n_jobs
+        self.jit = jit
+        # Held as the scalar type so self.dtype(9999) and to_numpy(dtype=self.dtype) both work
+        self.dtype = np.dtype(dtype).type
+        self.device = device
+        self.max_height = max_height
+        self.xp = cp if device == "cuda" else np
+        self._pool = None
+        self.clear_caches()
 
     def create_fitness(self):
         """
@@ -94,7 +171,11 @@ class DEAPLearningSystem(LearningSystem):
 
         self.pset = gp.PrimitiveSet("MAIN", arity=problem_arity)
         for func in self.func_list:
-            self.pset.addPrimitive(func_dict[func], len(signature(func_dict[func]).parameters), name=func)
+            # functions registered in func_dict after import are not in ARITY yet
+            arity = ARITY.get(func)
+            if arity is None:
+                arity = get_arity(func_dict[func])
+            self.pset.addPrimitive(func_dict[func], arity, name=func)
         #self.pset.addTerminal(2*np.pi)
 
         self.creator.create("Individual", gp.PrimitiveTree, fitness=self.Fitness,
@@ -106,8 +187,11 @@ class DEAPLearningSystem(LearningSystem):
 
     def create_and_reg_population(self):
         """
+        Registers the population generator under toolbox.population
 
         Currently uses bad model
+        Individuals are grown serially: tree growth is pure Python so threads gain nothing under the GIL,
+        and growing from several threads or processes would make the draws from random depend on scheduling so seeded runs would no longer repeat
         """
         self.toolbox.register("population", tools.initRepeat, list, self.toolbox.individual)
         return
@@ -130,7 +214,7 @@ class DEAPLearningSystem(LearningSystem):
         """
         self.toolbox.register("expr_mut", gp.genFull, min_=0, max_=2)
         self.toolbox.register("mutate", gp.mutUniform, expr=self.toolbox.expr_mut, pset=self.pset)
-        self.toolbox.decorate("mutate", gp.staticLimit(key=operator.attrgetter("height"), max_value=17))
+        self.toolbox.decorate("mutate", gp.staticLimit(key=operator.attrgetter("height"), max_value=self.max_height))
         return
        
     def reg_mating(self):
@@ -138,31 +222,122 @@ class DEAPLearningSystem(LearningSystem):
         Controls how e cross species
         """
         self.toolbox.register("mate", gp.cxOnePoint)
-        self.toolbox.decorate("mate", gp.staticLimit(key=operator.attrgetter("height"), max_value=17))
+        self.toolbox.decorate("mate", gp.staticLimit(key=operator.attrgetter("height"), max_value=self.max_height))
         return
 
-    def eval_helper(self, ind, X, y):
+    def compile_ind(self, ind, key=None):
+        """
+        Returns gp.compile of ind, cached by the string of ind so recurring trees are only compiled once
+        If jit is set and ind has been asked for jit_after times the result is the numba compiled version of the function
+
+        key can be given if str(ind) has already been computed, building the string walks the whole tree
+        """
+        if key is None:
+            key = str(ind)
+        # Entries are [function, number of times it was asked for]
+        entry = self._cache_get(self._compile_cache, key)
+        if entry is None:
+            entry = [gp.compile(ind, self.pset), 0]
+            self._cache_put(self._compile_cache, key, entry)
+        entry[1] += 1
+        if self.jit and entry[1] == self.jit_after:
+            entry[0] = self._jit(entry[0])
+        return entry[0]
+
+    def _jit(self, func):
+        """
+        Returns a function that runs func through numba.njit and permanently falls back to func the first time numba fails to compile it
+        The jitted attribute of the returned function is False once it has fallen back
+
+        The primitives of the pset are njit compiled as well so the whole tree is compiled into one function
+        """
+        if self._jit_context is None:
+            self._jit_context = {name: numba.njit(prim, error_model="numpy") if isinstance(prim, types.FunctionType) else prim for name, prim in self.pset.context.items()}
+        jitted = numba.njit(types.FunctionType(func.__code__, self._jit_context), error_model="numpy")
+        current = [jitted]
+        def call(*args):
+            try:
+                return current[0](*args)
+            except numba.core.errors.NumbaError:
+                current[0] = func
+                call.jitted = False
+                return func(*args)
+        call.jitted = True
+        return call
+
+    def cached_eval_helper(self, ind):
+        """
+        Returns eval_helper of ind on the fixed dataset, memoized by the string of ind
+        Only valid while X and y do not change i.e after reg_eval
+        """
+        key = str(ind)
+        fit = self._cache_get(self._fit_cache, key)
+        if fit is None:
+            fit = self.eval_helper(ind, key=key)
+            self._cache_put(self._fit_cache, key, fit)
+        return fit
+
+    def _cache_get(self, cache, key):
+        """
+        Returns the value stored under key in an LRU cache or None if it is missing
+        """
+        if key not in cache:
+            return None
+        cache.move_to_end(key)
+        return cache[key]
+
+    def _cache_put(self, cache, key, value):
+        """
+        Stores value under key in an LRU cache, evicting the least recently used entry once cache_size is exceeded
+        """
+        cache[key] = value
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return
+
+    def clear_caches(self):
+        """
+        Empties the fitness and compile caches. Must be called whenever the pset or the dataset changes
+        """
+        self._fit_cache = OrderedDict()
+        self._compile_cache = OrderedDict()
+        self._jit_context = None
+        self._X_cols = None
+        self._y_arr = None
+        self._X_cols_host = None
+        self._y_arr_host = None
+        return
+
+    def eval_helper(self, ind, X=None, y=None, key=None):
         """
         Given an X and a y returns the mse + addfunc of a given ind
+        Uses the dataset cached by reg_eval if X and y are not given
+        key is passed on to compile_ind
         """
-        self.func = gp.compile(ind, self.pset)
+        self.func = self.compile_ind(ind, key=key)
         mse = self._mse(self.func, X, y)
+        if X is None:
+            X, y = self.X, self.y
         a = self.add_func(self, X, y) 
         return (mse + a,)
 
-    def mse_helper(self, ind, X, y):
+    def mse_helper(self, ind, X=None, y=None):
         """
         Given an X and a y returns the mse of a given ind
+        Uses the dataset cached by reg_eval if X and y are not given
         """
-        self.func = gp.compile(ind, self.pset)
+        self.func = self.compile_ind(ind)
         mse = self._mse(self.func, X, y)
         return (mse, )
 
-    def add_func_helper(self, ind, X, y):
+    def add_func_helper(self, ind, X=None, y=None):
         """
         Given an X and a y returns the mse of a given ind
+        Uses the dataset cached by reg_eval if X and y are not given
         """
-        self.func = gp.compile(ind, self.pset)
+        self.func = self.compile_ind(ind)
+        if X is None:
+            X, y = self.X, self.y
         a = self.add_func(self, X, y)
         return (a, )
 
@@ -177,9 +352,55 @@ class DEAPLearningSystem(LearningSystem):
         ------------
         X, y - Data columns and target series
         """
-        self.toolbox.register('evaluate', self.eval_helper, X=X , y=y)
+        self.X = X
+        self.y = y
+        # X and y are fixed for the whole fit so the arrays every evaluation needs are extracted once
+        # On cuda they are copied to the GPU once here and every primitive dispatches to cupy from then on
+        # The host arrays are kept as well for vectorized constraints, on cpu they are the same objects
+        self._X_cols_host = tuple(X[c].to_numpy(dtype=self.dtype, copy=False) for c in X.columns)
+        self._y_arr_host = y.to_numpy(dtype=self.dtype, copy=False)
+        self._X_cols = tuple(self.xp.asarray(col) for col in self._X_cols_host)
+        self._y_arr = self.xp.asarray(self._y_arr_host)
+        self.toolbox.register('evaluate', self.cached_eval_helper)
+        self.toolbox.register('map', self.batch_map)
         return
 
+    def batch_map(self, func, inds):
+        """
+        Evaluates a whole generation at once if func is toolbox.evaluate, otherwise maps func over inds
+
+        Every individual is run on the cached column arrays and its prediction is reduced to an mse straight away, so only one prediction is alive at a time
+        Individuals already in the fitness cache are not evaluated again
+        Assumes reg_eval has been called
+        """
+        if func is not self.toolbox.evaluate:
+            return list(map(func, inds))
+        inds = list(inds)
+        keys = [str(ind) for ind in inds]
+        fits = {}
+        for key in keys:
+            fit = self._cache_get(self._fit_cache, key)
+            if fit is not None:
+                fits[key] = fit
+        todo = {}
+        for key, ind in zip(keys, inds):
+            if key not in fits and key not in todo:
+                todo[key] = ind
+        if len(todo) > 0:
+            mses = []
+            adds = []
+            for key, ind in todo.items():
+                self.func = self.compile_ind(ind, key=key)
+                pred = self._get_result_array(self.func, self.X, cols=self._X_cols)
+                mses.append(self._mean_square(pred - self._y_arr))
+                adds.append(self.add_func(self, self.X, self.y))
+            # The mses stay on the device until the whole generation is done so there is one copy to the host
+            mses = self._to_host(self.xp.stack(mses))
+            for key, mse, a in zip(todo.keys(), mses, adds):
+                fits[key] = (mse + a,)
+                self._cache_put(self._fit_cache, key, fits[key])
+        return [fits[key] for key in keys]
+
     def reg_gen_eval(self, generator):
         """
         registered the evaluation method using a generator
@@ -194,16 +415,18 @@ class DEAPLearningSystem(LearningSystem):
         self.toolbox.register('evaluate', eval, gen=generator)
         return
 
-    def reg_mse(self, X, y):
+    def reg_mse(self, X=None, y=None):
         """
         registered the mse evaluation under toolbox.mse
+        Uses the dataset cached by reg_eval if X and y are not given
         """
         self.toolbox.register('mse', self.mse_helper, X=X, y=y)
         return
 
-    def reg_add_func(self, X, y):
+    def reg_add_func(self, X=None, y=None):
         """
         registered the add_func evaluation under toolbox.addfunc
+        Uses the dataset cached by reg_eval if X and y are not given
         """
         self.toolbox.register('addfunc', self.add_func_helper, X=X, y=y)
         return
@@ -229,6 +452,41 @@ class DEAPLearningSystem(LearningSystem):
         return
 
 
+    def reg_map(self):
+        """
+        Registers a process pool map under toolbox.map so the population is evaluated in parallel
+        Does nothing if n_jobs is 1
+
+        Must be called after the evaluation functions are registered as the workers are forked with a copy of this object
+        """
+        if self.n_jobs == 1 or self.algorithm == "lgml":
+            # lgml evaluates on data that grows every generation so the forked copies would go stale
+            return
+        # fork hands the workers this object as is, spawn would have to pickle it along with the add_func lambdas and toolbox closures
+        self._pool = multiprocessing.get_context("fork").Pool(self.n_jobs, initializer=_init_worker, initargs=(self,))
+        self.toolbox.register("map", self.pool_map)
+        return
+
+    def pool_map(self, func, inds):
+        """
+        Maps func over inds with the process pool if func is one of the registered evaluation functions
+        Anything else is mapped serially
+        """
+        for alias in ("evaluate", "mse", "addfunc"):
+            if func is getattr(self.toolbox, alias, None):
+                return self._pool.map(partial(_worker_call, alias), inds)
+        return list(map(func, inds))
+
+    def close_pool(self):
+        """
+        Shuts down the process pool if one is running
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        return
+
     def extendX(self, addition_dataframe):
         """
         Updates X
@@ -257,33 +515,110 @@ class DEAPLearningSystem(LearningSystem):
         self.toolbox.register('extendy', self.extendy)
         self.toolbox.register('evaluate', self.eval_helper)
         self.toolbox.register('get_violation_frame', self.lgml_func, dls=self, gen=gen)
-        self.toolbox.register('compile', gp.compile, pset=self.pset)
+        self.toolbox.register('compile', self.compile_ind)
         return
         
     def get_result(self, func, X, y):
         """
         Returns a series that holds all the values func(X)
+
+        Kept as a series indexed like X since constraints combine it with columns of X and masks taken from X
+        Internally the fitness is computed from _get_result_array which never builds a series
+        """
+        return pd.Series(self._get_result_array(func, X), index=X.index)
+
+    def get_result_from_arrays(self, func, cols):
+        """
+        Returns a numpy array that holds all the values func(X) given the columns of X as numpy arrays
+        """
+        return self._to_host(self._get_result_array(func, None, cols=cols))
+
+    def get_arrays(self, X, y):
+        """
+        Returns the columns of X as a tuple of numpy arrays and y as a numpy array
+        The arrays cached by reg_eval are reused when X is the training data
+        """
+        if self._X_cols_host is not None and X is self.X:
+            return self._X_cols_host, self._y_arr_host
+        return tuple(X[c].to_numpy(dtype=self.dtype, copy=False) for c in X.columns), y.to_numpy(dtype=self.dtype, copy=False)
+
+    def _get_result_array(self, func, X, cols=None):
+        """
+        Returns an ndarray that holds all the values func(X)
+
+        func is called once on whole columns so the primitives run vectorized over the dataset
+        Falls back to calling func row by row if the vectorized call fails
+        Non finite values (overflow, division by zero, log of a negative etc) are replaced with 9999
+        cols can be given to reuse column arrays already extracted from X
+        """
+        n = len(X) if cols is None else len(cols[0])
+        if cols is None:
+            cols = [X[c].to_numpy(dtype=self.dtype, copy=False) for c in X.columns]
+        xp = self._array_module(cols[0])
+        try:
+            with np.errstate(all='ignore'):
+                arr = xp.asarray(func(*cols), dtype=self.dtype).ravel()
+            # A single value can also come from a primitive that collapsed the whole column, row by row is always right
+            if arr.size != n:
+                raise ValueError(f"Vectorized result has {arr.size} values for {n} rows")
+        except Exception:
+            arr = xp.asarray(self._get_result_rowwise(func, [self._to_host(col) for col in cols]))
+        return xp.where(xp.isfinite(arr), arr, self.dtype(9999))
+
+    def _array_module(self, arr):
+        """
+        Returns cupy if arr lives on the GPU and numpy otherwise
+        """
+        if cp is None:
+            return np
+        return cp.get_array_module(arr)
+
+    def _to_host(self, arr):
+        """
+        Returns arr as a numpy array, copying it off the GPU if needed
+        """
+        if cp is None:
+            return arr
+        return cp.asnumpy(arr)
+
+    def _get_result_rowwise(self, func, cols):
+        """
+        Returns an ndarray that holds all the values func(X) computing func one row at a time over the column arrays of X
+        Only used for equations whose primitives cannot take whole columns
         """
         def temp(row):
                 try:
-                    val = func(*row)
+                    with np.errstate(all='ignore'):
+                        val = func(*row)
                     #print(f"Value {val} was succesfully calculated for {str(expr)}")
-                    return val
-                except:
-                    traceback.print_exc()
+                    # Primitives may hand back a 1 entry series or array rather than a number
+                    return np.asarray(val, dtype=np.float64).ravel()[0]
+                except Exception:
+                    if self.verbose:
+                        traceback.print_exc()
                     return 9999
-        X['result'] = X.copy().apply(lambda row: temp(row), axis=1)
-        to_return = X['result'].copy()
-        X.drop('result', axis=1, inplace=True)
-        return to_return
+        return np.array([temp(row) for row in zip(*cols)], dtype=self.dtype)
 
     def _mse(self, func, X, y):
         """
         Returns the mean square error of a function which can compute the value of f(X)
+        Uses the arrays cached by reg_eval if X and y are not given
+        """
+        if X is None:
+            preds = self._get_result_array(func, self.X, cols=self._X_cols)
+            return float(self._mean_square(preds - self._y_arr))
+        preds = self._get_result_array(func, X)
+        return self._mean_square(preds - y.to_numpy(dtype=self.dtype))
+
+    def _mean_square(self, diff):
+        """
+        Returns the mean of diff**2, accumulated in float64
+
+        Computed as a dot product of diff with itself so no array of squares is allocated
         """
-        preds = self.get_result(func, X, y)
-        diff = preds - y
-        return np.mean(diff**2)
+        xp = self._array_module(diff)
+        diff = diff.astype(np.float64, copy=False)
+        return xp.dot(diff, diff) / diff.size
 
     def ind_score(self, ind, X, y):
         """
@@ -295,7 +630,7 @@ class DEAPLearningSystem(LearningSystem):
         ------------
         X, y - Data columns and target series
         """
-        self.func = gp.compile(ind, self.pset)
+        self.func = self.compile_ind(ind)
         mse = self._mse(self.func, X, y)
         violation = self.add_func(self, X, y)
         return (mse, violation)
@@ -314,6 +649,8 @@ class DEAPLearningSystem(LearningSystem):
             Remember 
                 you can use dls.func to get the function to get the functional transformation
                 you can use dls.get_result to get the preds in a series
+            If fun is decorated with Constraints.vectorized_constraint it receives X_cols, a tuple of the columns of X, and y as numpy arrays instead
+                you can use dls.get_result_from_arrays to get the preds as an array
         """
         self.add_func = func
 
@@ -334,6 +671,8 @@ class DEAPLearningSystem(LearningSystem):
         Clears all working data so it was as if this object was a newly created DEAPLearnSystem immediately after initialization
         """
         self.toolbox = base.Toolbox()
+        self.close_pool()
+        self.clear_caches()
         try:
             del self.Fitness
             del self.pset
@@ -352,11 +691,14 @@ class DEAPLearningSystem(LearningSystem):
         arity = self.get_arity_from_X(X)
         if self.algorithm == "lgml":
             raise ValueError(f"Trying to use algorithm lgml with a fixed X and y dataset. This is not permitted. To use LGML algorithm please call on model fit with fit_gen and provide a generator.")
+        if self.jit:
+            raise ValueError(f"Trying to use jit with a fixed X and y dataset. Every equation is only evaluated once so it would never be JIT compiled. To use jit please call fit_gen and provide a generator.")
         self.invariant_build_model(arity, tournsize)
         self.reg_eval(X, y)
         if self.algorithm == "earlyswitcher":
-            self.reg_mse(X, y)
-            self.reg_add_func(X, y)
+            self.reg_mse()
+            self.reg_add_func()
+        self.reg_map()
         return
 
     def build_gen_model(self, generator, tournsize=15):
@@ -373,7 +715,7 @@ class DEAPLearningSystem(LearningSystem):
             if self.algorithm == "earlyswitcher":
                 self.reg_gen_mse(generator)
                 self.reg_gen_add_func(generator)
-
+        self.reg_map()
         return
 
     def invariant_build_model(self, arity, tournsize):
@@ -405,7 +747,10 @@ class DEAPLearningSystem(LearningSystem):
         Clears the existing trained model every time fit is called
         """
         self.hof = tools.HallOfFame(1)
-        pop, log = get_algorithm(self.algorithm)(population=self.toolbox.population(self.population_size), toolbox=self.toolbox, cxpb=self.crossover_prob, mutpb=self.mutation_prob, ngen=self.ngens, halloffame=self.hof, verbose=self.verbose)
+        try:
+            pop, log = get_algorithm(self.algorithm)(population=self.toolbox.population(self.population_size), toolbox=self.toolbox, cxpb=self.crossover_prob, mutpb=self.mutation_prob, ngen=self.ngens, halloffame=self.hof, verbose=self.verbose)
+        finally:
+            self.close_pool()
         return pop, log
 
     def fit(self, X, y):
@@ -744,8 +1089,8 @@ class Algorithms():
 
 algo_dict = {
         "simple" : algorithms.eaSimple,
-        "mu+lambda" : lambda population, toolbox, cxpb, mutpb, ngen,  halloffame, verbose : algorithms.eaMuPlusLambda(population=population, toolbox=toolbox, mu=Algorithms.mu, lambda_=Algorithms.lambda_, cxpb=cxpb, mutpb=mutpb, ngen=ngen, halloffame=halloffame, verbose=verbose),
-        "mu,lambda" : lambda population, toolbox, cxpb, mutpb, ngen,  halloffame, verbose : algorithms.eaMuCommaLambda(population=population, toolbox=toolbox, mu=Algorithms.mu, lambda_=Algorithms.lambda_, cxpb=cxpb, mutpb=mutpb, ngen=ngen, halloffame=halloffame, verbose=verbose),        
+        "mu+lambda" : partial(algorithms.eaMuPlusLambda, mu=Algorithms.mu, lambda_=Algorithms.lambda_),
+        "mu,lambda" : partial(algorithms.eaMuCommaLambda, mu=Algorithms.mu, lambda_=Algorithms.lambda_),
         "custom"    : Algorithms.basic_self,
         "lgml"      : Algorithms.lgml_algorithm,
         "earlyswitcher": Algorithms.early_switcher
@@ -758,10 +1103,9 @@ def get_algorithm(key):
         Returns the algorithm function associated with the key
         Defaults to eaSimple if key not found
         """
-        if key not in algo_dict.keys():
+        if key not in algo_dict:
             print(f"Key {key} not found out of available algorithm options. Using Simple Algorithm")
-            return algorithms.eaSimple
-        return algo_dict.get(key, algo_dict.get("simple"))
+        return algo_dict.get(key, algorithms.eaSimple)
 
 
 
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("deap")
+numba = pytest.importorskip("numba")
+
+from deap import gp
+from LearningSystems.DEAPLearningSystem import DEAPLearningSystem
+
+
+PROTECTED = {
+    "div" : "div(ARG0, ARG1)",
+    "exp" : "exp(ARG0)",
+    "pow" : "pow(ARG0, ARG1)",
+    "log" : "log(ARG0)",
+    "inv" : "inv(ARG0)",
+    "sqrt" : "sqrt(ARG0)",
+    "square" : "square(ARG0)",
+}
+
+
+def build_system(jit):
+    dls = DEAPLearningSystem(func_list=list(PROTECTED.keys()), jit=jit)
+    dls.jit_after = 1
+    dls.create_fitness()
+    dls.create_and_reg_individual(2)
+    return dls
+
+
+@pytest.mark.parametrize("name", list(PROTECTED.keys()))
+def test_jit_matches_python_on_protected_primitives(name):
+    X = pd.DataFrame({"X0" : [2, 1e3, -1, 0, 1e-7, 150, -200, 0.5],
+                      "X1" : [3, 400, 0.5, 0, 1e-5, 2, -3, 1e-9]})
+    results = []
+    for jit in (False, True):
+        dls = build_system(jit)
+        ind = gp.PrimitiveTree.from_string(PROTECTED[name], dls.pset)
+        func = dls.compile_ind(ind)
+        results.append(dls._get_result_array(func, X))
+    # _jit falls back to the Python function if numba fails, which would make the comparison Python against Python
+    assert func.jitted
+    assert isinstance(dls._jit_context[name], numba.core.registry.CPUDispatcher)
+    np.testing.assert_allclose(results[1], results[0], rtol=1e-12)
@@ -0,0 +1,48 @@
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("deap")
+
+from Constraints import vectorized_constraint
+from LearningSystems.DEAPLearningSystem import DEAPLearningSystem
+
+
+@vectorized_constraint
+def upper_bound(dls, X_cols, y, weight=1):
+    assert all(isinstance(col, np.ndarray) for col in X_cols)
+    assert isinstance(y, np.ndarray)
+    pred = dls.get_result_from_arrays(dls.func, X_cols)
+    return float(np.max(np.append(pred - X_cols[0], 0)))*weight
+
+
+@vectorized_constraint
+def not_a_number(dls, X_cols, y):
+    return X_cols[0]
+
+
+def make_data():
+    rng = np.random.RandomState(0)
+    X = pd.DataFrame({"X0" : rng.uniform(1, 10, 50), "X1" : rng.uniform(1, 10, 50)})
+    y = X["X0"]*X["X1"]/(X["X0"] + X["X1"])
+    return X, y
+
+
+@pytest.mark.parametrize("add_func", [upper_bound, lambda dls, x, y : upper_bound(dls, x, y, weight=2.0)],
+                         ids=["direct", "wrapped"])
+def test_vectorized_constraint_fits(add_func):
+    X, y = make_data()
+    random.seed(0)
+    dls = DEAPLearningSystem(ngens=2, population_size=20)
+    dls.set_add_func(add_func)
+    dls.fit(X, y)
+    assert np.isfinite(dls.score(X, y)[0])
+
+
+def test_vectorized_constraint_must_return_a_number():
+    X, y = make_data()
+    dls = DEAPLearningSystem()
+    with pytest.raises(ValueError):
+        not_a_number(dls, X, y)